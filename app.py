@@ -1,128 +1,326 @@
 import streamlit as st
-import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import numpy as np
-import google.generativeai as genai
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timedelta
-from PIL import Image
+from itertools import zip_longest
+from typing import TypedDict
 
 # --- 1. CONFIGURATION & SETUP ---
 st.set_page_config(page_title="The Honest Plate", page_icon="🥑", layout="centered")
 
 # Initialize Gemini
+# google.generativeai (protobuf/grpc) is heavy, so it's imported on first use only
 try:
-    if "GEMINI_API_KEY" in st.secrets:
-        genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
-    else:
+    if "GEMINI_API_KEY" not in st.secrets:
         st.error("Missing Gemini API Key in secrets.toml")
 except Exception as e:
     st.error(f"Gemini Config Error: {e}")
 
+# Small/fast model tier; output is forced to JSON matching MealEstimate
+GEMINI_MODEL = "gemini-2.5-flash-lite"
+
+class MealEstimate(TypedDict):
+    food: str
+    calories: int
+    flag: str
+
+@st.cache_resource
+def get_gemini():
+    import google.generativeai as genai
+    genai.configure(api_key=st.secrets["GEMINI_API_KEY"])
+    return genai
+
 # Initialize Google Sheets Connection
-def get_db_connection():
+# Cached per process so reruns don't redo OAuth + open() every click
+@st.cache_resource(ttl=3600)
+def _get_client():
+    import gspread
+    from google.oauth2.service_account import Credentials
+
     scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
     
     # CHECK: Are we on Cloud or Local?
     if "GCP_CREDENTIALS" in st.secrets:
         # Cloud Mode (Deployment)
         creds_dict = dict(st.secrets["GCP_CREDENTIALS"])
-        creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
+        creds = Credentials.from_service_account_info(creds_dict, scopes=scope)
     else:
         # Local Mode (Development)
         # It looks for the file you created in Phase 1
-        creds = ServiceAccountCredentials.from_json_keyfile_name("service_account.json", scope)
+        creds = Credentials.from_service_account_file("service_account.json", scopes=scope)
     
-    client = gspread.authorize(creds)
-    return client.open("Honest_Plate_DB") 
+    # google-auth keeps the bearer token until it expires, so reuse skips the JWT signing
+    # The cached client's requests session already keeps connections alive (pool of 10)
+    return gspread.authorize(creds)
+
+@st.cache_resource(ttl=3600)
+def get_db_connection():
+    return _get_client().open("Honest_Plate_DB")
+
+# Cached sheet reads: reruns hit memory instead of pulling every row again.
+# Call _load_sheet.clear() after any write so the next read is fresh.
+@st.cache_data(ttl=60)
+def _load_sheet(name: str, ranges: tuple = ()) -> list:
+    ws = get_db_connection().worksheet(name)
+    if not ranges:
+        return ws.get_all_records()
+    # Only pull the columns we need: one list-of-rows per A1 range
+    return [list(r) for r in ws.batch_get(list(ranges), value_render_option="UNFORMATTED_VALUE")]
+
+def _sheet_day(value):
+    # UNFORMATTED_VALUE returns real date cells as serial numbers (days since 1899-12-30)
+    if isinstance(value, (int, float)):
+        return np.datetime64("1899-12-30") + int(value)
+    return np.datetime64(str(value)[:10])
+
+# Local write-ahead log: Save lands in SQLite instantly, a background thread
+# batch-uploads unsynced rows to Food_Logs with one append_rows call.
+# Delivery is at-least-once: rows are marked synced only after append_rows
+# returns, so a timeout after a successful write re-uploads that batch.
+LOCAL_DB = "local.db"
+SYNC_EVERY_SECS = 5
+FOOD_LOG_COLS = "ts, day, user_id, meal, mode, food, cals, final_cals, flag, time_offset"
+
+# Final_Cals (col H) is computed in Sheets: raw cals (G) x the user's Inflation_Factor
+# (User_Profiles col H), so changing the factor re-prices every historical row.
+# INDEX(col, ROW()) makes it work wherever append_rows lands the row without
+# INDIRECT, which is volatile and would recalc every row on any edit.
+FINAL_CALS_FORMULA = '=INT(INDEX(G:G,ROW())*IFERROR(VLOOKUP(INDEX(C:C,ROW()),User_Profiles!A:H,8,FALSE),1))'
+
+def _local_db():
+    db = sqlite3.connect(LOCAL_DB)
+    db.execute(f"CREATE TABLE IF NOT EXISTS food_logs ({FOOD_LOG_COLS}, synced INTEGER DEFAULT 0)")
+    return db
+
+@st.cache_resource
+def _sync_lock():
+    return threading.Lock()
+
+def _literal(value):
+    # Rows go up as USER_ENTERED (for the Final_Cals formula), which would turn
+    # text starting with =+-@ into formulas and ts/day into date serials.
+    # A leading ' keeps the cell a literal string, same as RAW.
+    return f"'{value}" if isinstance(value, str) else value
+
+def queue_food_log(row):
+    with closing(_local_db()) as db, db:
+        db.execute(f"INSERT INTO food_logs ({FOOD_LOG_COLS}) VALUES (?,?,?,?,?,?,?,?,?,?)", row)
+
+def pending_food_logs(user_id):
+    with closing(_local_db()) as db:
+        return db.execute("SELECT COUNT(*) FROM food_logs WHERE synced = 0 AND user_id = ?", (str(user_id),)).fetchone()[0]
+
+def flush_food_logs():
+    with _sync_lock(), closing(_local_db()) as db, db:
+        rows = db.execute(f"SELECT rowid, {FOOD_LOG_COLS} FROM food_logs WHERE synced = 0 ORDER BY rowid").fetchall()
+        if not rows:
+            return
+        cols = FOOD_LOG_COLS.split(", ")
+        values = [[v if col == "final_cals" else _literal(v) for col, v in zip(cols, r[1:])] for r in rows]
+        get_db_connection().worksheet("Food_Logs").append_rows(values, value_input_option="USER_ENTERED")
+        db.executemany("UPDATE food_logs SET synced = 1 WHERE rowid = ?", [(r[0],) for r in rows])
+    _load_sheet.clear()
+
+@st.cache_resource
+def _start_sync_worker():
+    # One daemon thread per process, shared by every session
+    def loop():
+        while True:
+            time.sleep(SYNC_EVERY_SECS)
+            try:
+                flush_food_logs()
+            except Exception:
+                pass  # rows stay queued locally, retry next tick
+    # No ScriptRunContext attached: the thread outlives any one session and makes no st.* calls
+    t = threading.Thread(target=loop, name="food-log-sync", daemon=True)
+    t.start()
+    return t
 
 # --- 2. CORE LOGIC (DATA ENGINEERING) ---
 
+ACTIVITY_LEVELS = ["Sedentary", "Lightly Active", "Moderately Active", "Very Active"]
+ACTIVITY_MULTIPLIERS = np.array([1.2, 1.375, 1.55, 1.725])
+
+def tdee_vec(age, gender, height, weight, act_idx):
+    # Mifflin-St Jeor Equation, vectorized so whole User_Profiles columns work too
+    base = 10 * np.asarray(weight) + 6.25 * np.asarray(height) - 5 * np.asarray(age)
+    return (base + np.where(np.asarray(gender) == 'Male', 5, -161)) * ACTIVITY_MULTIPLIERS[act_idx]
+
 def calculate_tdee(age, gender, height, weight, activity):
-    # Mifflin-St Jeor Equation
-    if gender == 'Male':
-        bmr = (10 * weight) + (6.25 * height) - (5 * age) + 5
-    else:
-        bmr = (10 * weight) + (6.25 * height) - (5 * age) - 161
-    
-    multipliers = {
-        "Sedentary": 1.2,
-        "Lightly Active": 1.375,
-        "Moderately Active": 1.55,
-        "Very Active": 1.725
-    }
-    return int(bmr * multipliers.get(activity, 1.2))
+    act_idx = ACTIVITY_LEVELS.index(activity) if activity in ACTIVITY_LEVELS else 0
+    return int(tdee_vec(age, gender, height, weight, act_idx))
 
 def get_or_create_profile(user_id):
     try:
-        conn = get_db_connection()
-        ws = conn.worksheet("User_Profiles")
-        data = ws.get_all_records()
-        df = pd.DataFrame(data)
+        records = _load_sheet("User_Profiles")
         
-        # Check if user exists
-        if not df.empty and "User_ID" in df.columns:
-            # Convert User_ID to string to be safe
-            df["User_ID"] = df["User_ID"].astype(str)
-            user_row = df[df["User_ID"] == str(user_id)]
-            
-            if not user_row.empty:
-                return user_row.iloc[0].to_dict()
+        # Check if user exists (compare as strings to be safe)
+        uid = str(user_id)
+        row = next((r for r in records if str(r.get("User_ID")) == uid), None)
+        if row is not None:
+            return dict(row, User_ID=uid)
         
         return None 
     except Exception as e:
         st.error(f"DB Error: {e}")
         return None
 
+def _calibrate_nb(days, weights, total_cals, n_meals, tdee):
+    # --- SIMPLE REGRESSION ---
+    # Closed-form least squares; compiled by _calibration_kernel when numba is available
+    xm = days.mean()
+    ym = weights.mean()
+    sxy = 0.0
+    sxx = 0.0
+    for i in range(days.size):
+        dx = days[i] - xm
+        sxy += dx * (weights[i] - ym)
+        sxx += dx * dx
+    slope = sxy / sxx if sxx > 0 else 0.0 # Slope = kg change per day
+    
+    avg_reported_cals = total_cals / n_meals if n_meals > 0 else 0.0
+    
+    expected_intake = tdee + (slope * 7700) 
+    
+    if avg_reported_cals > 0:
+        inflation_factor = expected_intake / avg_reported_cals
+    else:
+        inflation_factor = 1.0
+        
+    return max(0.8, min(inflation_factor, 1.5)), slope
+
+@st.cache_resource
+def _calibration_kernel():
+    # JIT once per process (reruns would otherwise rebuild the dispatcher), and only
+    # pull in numba/llvmlite when calibration actually runs
+    try:
+        from numba import njit
+    except ImportError:  # plain Python fallback
+        return _calibrate_nb
+    return njit(cache=True)(_calibrate_nb)
+
+@st.cache_data(ttl=300)
+def _calibrate(wkey: int, w_bytes: bytes, f_bytes: bytes, tdee: float):
+    x, y = np.frombuffer(w_bytes).reshape(2, wkey)
+    total, c = np.frombuffer(f_bytes)
+    
+    inflation_factor, slope = _calibration_kernel()(x, y, float(total), float(c), float(tdee))
+    
+    return round(float(inflation_factor), 2), f"Slope: {slope:.3f} kg/day"
+
 def run_calibration_engine(user_id):
     """
     The Linear Regression Logic.
     """
     try:
-        conn = get_db_connection()
-        weight_data = conn.worksheet("Weight_Logs").get_all_records()
-        food_data = conn.worksheet("Food_Logs").get_all_records()
+        # Weight_Logs: Date | User_ID | Weight_kg
+        # Food_Logs: only User_ID (C) and Final_Cals (H)
+        # Both reads are independent network calls, so fetch them concurrently
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(2, initializer=add_script_run_ctx, initargs=(None, ctx)) as ex:
+            w_fut = ex.submit(_load_sheet, "Weight_Logs", ("A2:C",))
+            f_fut = ex.submit(_load_sheet, "Food_Logs", ("C2:C", "H2:H"))
+            (weight_rows,) = w_fut.result()
+            food_users, food_cals = f_fut.result()
         
-        if not weight_data or not food_data:
+        if not weight_rows or not food_users:
             return 1.0, "Not enough data"
-
-        w_df = pd.DataFrame(weight_data)
-        f_df = pd.DataFrame(food_data)
         
-        # Filter for User
+        # Filter for User in a single pass, copying out only the columns we need
         # Ensure User_ID columns match types
-        w_df = w_df[w_df["User_ID"].astype(str) == str(user_id)]
-        f_df = f_df[f_df["User_ID"].astype(str) == str(user_id)]
+        uid = str(user_id)
+        dates, weights = [], []
+        for row in weight_rows:
+            if len(row) >= 3 and str(row[1]) == uid:
+                dates.append(row[0])
+                weights.append(row[2])
         
-        if len(w_df) < 5: 
-            return 1.0, "Need 5+ weigh-ins"
-            
-        # --- SIMPLE REGRESSION ---
-        w_df['DateObj'] = pd.to_datetime(w_df['Date'])
-        w_df['DayIndex'] = (w_df['DateObj'] - w_df['DateObj'].min()).dt.days
+        total = 0.0
+        c = 0
+        for u, cal in zip_longest(food_users, food_cals, fillvalue=[]):
+            if u and str(u[0]) == uid:
+                total += float((cal or [0])[0] or 0)
+                c += 1
         
-        x = w_df['DayIndex'].values
-        y = w_df['Weight_kg'].values
-        slope, intercept = np.polyfit(x, y, 1) # Slope = kg change per day
-        
-        avg_reported_cals = f_df['Final_Cals'].mean()
-        tdee = st.session_state.get('profile', {}).get('TDEE', 2000)
-        
-        expected_intake = tdee + (slope * 7700) 
-        
-        if avg_reported_cals > 0:
-            inflation_factor = expected_intake / avg_reported_cals
-        else:
-            inflation_factor = 1.0
+        if len(weights) < 5: 
+            return 1.0, "Need 5+ weigh-ins"
             
-        inflation_factor = max(0.8, min(inflation_factor, 1.5))
+        days = np.array([_sheet_day(d) for d in dates], dtype="datetime64[D]")
+        x = (days - days.min()).astype(float)
+        y = np.fromiter((float(w) for w in weights), dtype=float, count=len(weights))
+        tdee = float(st.session_state.get('profile', {}).get('TDEE', 2000))
         
-        return round(inflation_factor, 2), f"Slope: {slope:.3f} kg/day"
+        # Only the minimal columns go in as bytes, so repeat clicks with no new logs hit the cache
+        w_bytes = np.stack([x, y]).tobytes()
+        f_bytes = np.array([total, c], dtype=float).tobytes()
+        return _calibrate(len(weights), w_bytes, f_bytes, tdee)
 
     except Exception as e:
         # st.error(f"Engine Error: {e}") # Uncomment to debug
         return 1.0, "Insufficient Data"
 
+# Retries of the exact same photo/text are served from cache instead of re-calling Gemini.
+# _payload is skipped by st.cache_data's hasher; payload_hash is the key.
+@st.cache_data(ttl=3600)
+def _analyze(payload_hash: str, kind: str, _payload) -> dict:
+    # Initialize Model
+    genai = get_gemini()
+    model = genai.GenerativeModel(GEMINI_MODEL, generation_config={
+        "response_mime_type": "application/json",
+        "response_schema": MealEstimate,
+    })
+
+    # LOGIC: Switch Prompt based on Input Type
+    if kind == "Text":
+
+        prompt = """
+        You are an expert Nutritionist and Calorie Auditor. Analyze this food description text.
+        1. Identify every food item and specific quantity mentioned (e.g., "2 slices", "1 cup").
+        2. If quantity is vague (e.g., "a bowl"), assume a standard medium serving.
+        3. Estimate calories based on standard database values.
+        4. SUM the total calories.
+
+        Return food (name), calories (total, integer) and flag (macronutrient flag).
+        Example: {"food": "Banana & Coffee", "calories": 165, "flag": "High Sugar"}
+        """
+        # Call Gemini with Text only
+        resp = model.generate_content([prompt, _payload])
+
+    else:
+
+        prompt = """
+        You are an expert Nutritionist and Calorie Auditor. Analyze this food image with high precision.
+
+        Perform this internal "Chain of Thought" analysis before answering:
+        1. **Identify Components:** List every visible ingredient (e.g., "Kidney beans, spinach, thick gravy, white dollop").
+        2. **Volume Analysis:** Estimate portion size relative to the container (e.g., "This looks like a 1.5 cup serving in a standard glass bowl").
+        3. **The "Sheen" Test (CRITICAL):** Look at the surface texture.
+        - Does it look oily/glistening? -> If YES, add 100-150 kcal for hidden fats/ghee.
+        - Does it look matte/watery? -> If YES, assume boiled/steamed standard calories.
+        - **Do NOT assume 'generous oil' by default. Judge based on visuals.**
+        4. **Topping Audit:** Identify toppings (e.g., "Is that Greek Yogurt (low cal) or Sour Cream (high cal)?"). If ambiguous, choose the standard option (Yogurt for Indian food).
+        5. **Summation:** Add up the base + sauce + toppings.
+
+        **Strict Output Format:**
+        Return food (name), calories (total, integer) and flag (macronutrient flag).
+
+        Examples:
+        {"food": "Rajma Masala & Yogurt", "calories": 340, "flag": "High Protein"}
+        {"food": "Butter Chicken & Naan", "calories": 850, "flag": "High Fat"}
+        """
+        # Call Gemini with Prompt + Image (uploaded handle, or inline bytes)
+        image = genai.get_file(_payload) if isinstance(_payload, str) else _payload
+        resp = model.generate_content([prompt, image])
+
+    return json.loads(resp.text)
+
 # --- 3. UI: LOGIN ---
 
 # Magic Link Check
@@ -150,6 +348,7 @@ if "user_id" not in st.session_state:
 # --- 4. MAIN DASHBOARD ---
 
 USER = st.session_state["user_id"]
+_start_sync_worker()
 PROFILE = get_or_create_profile(USER)
 
 if not PROFILE:
@@ -166,6 +365,7 @@ if not PROFILE:
             conn = get_db_connection()
             ws = conn.worksheet("User_Profiles")
             ws.append_row([USER, age, gender, height, weight, act, tdee, 1.0])
+            _load_sheet.clear()
             st.success("Saved!")
             st.rerun()
     st.stop()
@@ -186,6 +386,18 @@ with tab_log:
     if "log_stage" not in st.session_state:
         st.session_state.log_stage = "input"
 
+    pending = pending_food_logs(USER)
+    if pending:
+        c1, c2 = st.columns([3, 1])
+        c1.caption(f"⏳ {pending} meal(s) waiting to sync")
+        if c2.button("Sync 🔄"):
+            try:
+                flush_food_logs()
+            except Exception as e:
+                st.warning(f"Sync failed, meals stay queued: {e}")
+            else:
+                st.rerun()
+
     if st.session_state.log_stage == "input":
         method = st.radio("Input", ["📷 Camera", "⌨️ Type"], horizontal=True, label_visibility="collapsed")
         
@@ -195,7 +407,22 @@ with tab_log:
         if method == "📷 Camera":
             img = st.camera_input("Snap photo")
             if img:
-                content = Image.open(img)
+                # Raw camera bytes go straight to Gemini (no PIL decode/re-encode).
+                # Upload once per photo; reruns/retries reuse the Files API handle
+                mime = img.type or "image/jpeg"
+                if img.file_id not in (st.session_state.get("gemini_file_src"), st.session_state.get("gemini_upload_failed")):
+                    try:
+                        f = get_gemini().upload_file(img, mime_type=mime)
+                        st.session_state["gemini_file"] = f.name
+                        st.session_state["gemini_file_src"] = img.file_id
+                    except Exception as e:
+                        # Don't retry this photo on every rerun; send the bytes inline instead
+                        st.session_state["gemini_upload_failed"] = img.file_id
+                        st.caption(f"⚠️ Upload failed, sending photo inline: {e}")
+                if st.session_state.get("gemini_file_src") == img.file_id:
+                    content = st.session_state["gemini_file"]
+                else:
+                    content = {"mime_type": mime, "data": img.getvalue()}
                 mode = "Image"
         else:
             txt = st.text_area("Describe food")
@@ -210,57 +437,17 @@ with tab_log:
             else:
                 with st.spinner("AI Analyzing..."):
                     try:
-                        # Initialize Model
-                        model = genai.GenerativeModel("gemini-2.5-flash")
-                        
-                        # LOGIC: Switch Prompt based on Input Type
-                        if mode == "Text":
-
-                            prompt = """
-                            You are an expert Nutritionist and Calorie Auditor. Analyze this food description text.
-                            1. Identify every food item and specific quantity mentioned (e.g., "2 slices", "1 cup").
-                            2. If quantity is vague (e.g., "a bowl"), assume a standard medium serving.
-                            3. Estimate calories based on standard database values.
-                            4. SUM the total calories.
-                            
-                            Return ONLY this format: 'Food Name | Total Calories (int) | Flag'
-                            Example: 'Banana & Coffee | 165 | High Sugar'
-                            """
-                            # Call Gemini with Text only
-                            resp = model.generate_content([prompt, content])
-
+                        # Hash only on Analyze, not on every rerun while a photo is showing
+                        if mode == "Image":
+                            raw = img.getbuffer()
                         else:
-                            
-                            prompt = """
-                            You are an expert Nutritionist and Calorie Auditor. Analyze this food image with high precision.
-                            
-                            Perform this internal "Chain of Thought" analysis before answering:
-                            1. **Identify Components:** List every visible ingredient (e.g., "Kidney beans, spinach, thick gravy, white dollop").
-                            2. **Volume Analysis:** Estimate portion size relative to the container (e.g., "This looks like a 1.5 cup serving in a standard glass bowl").
-                            3. **The "Sheen" Test (CRITICAL):** Look at the surface texture.
-                            - Does it look oily/glistening? -> If YES, add 100-150 kcal for hidden fats/ghee.
-                            - Does it look matte/watery? -> If YES, assume boiled/steamed standard calories.
-                            - **Do NOT assume 'generous oil' by default. Judge based on visuals.**
-                            4. **Topping Audit:** Identify toppings (e.g., "Is that Greek Yogurt (low cal) or Sour Cream (high cal)?"). If ambiguous, choose the standard option (Yogurt for Indian food).
-                            5. **Summation:** Add up the base + sauce + toppings.
-                            
-                            **Strict Output Format:**
-                            Return ONLY a single string in this format (no bolding, no extra text):
-                            Food Name | Total Calories (Integer) | Macronutrient Flag
-                            
-                            Examples:
-                            'Rajma Masala & Yogurt | 340 | High Protein'
-                            'Butter Chicken & Naan | 850 | High Fat'
-                            """
-                            # Call Gemini with Prompt + Image
-                            resp = model.generate_content([prompt, content])
-
-                        # --- PARSING THE RESPONSE (Same for both) ---
-                        parts = resp.text.split("|")
+                            raw = " ".join(txt.lower().split()).encode()
+                        payload_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                        meal = _analyze(payload_hash, mode, content)
                         st.session_state.temp_log = {
-                            "food": parts[0].strip(),
-                            "cals": int(parts[1].strip()),
-                            "flag": parts[2].strip() if len(parts)>2 else "None",
+                            "food": meal["food"].strip(),
+                            "cals": int(meal["calories"]),
+                            "flag": meal.get("flag") or "None",
                             "mode": mode,
                             "offset": offset
                         }
@@ -275,13 +462,11 @@ with tab_log:
         
         if st.button("Save ✅", use_container_width=True):
             # Save Logic
-            final_cals = int(data['cals'] * INFLATION_FACTOR)
             now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             today = datetime.now().strftime("%Y-%m-%d")
             
-            conn = get_db_connection()
-            conn.worksheet("Food_Logs").append_row([
-                now, today, USER, "Meal", data['mode'], data['food'], data['cals'], final_cals, data['flag'], data['offset']
+            queue_food_log([
+                now, today, USER, "Meal", data['mode'], data['food'], data['cals'], FINAL_CALS_FORMULA, data['flag'], data['offset']
             ])
             st.success("Logged!")
             st.session_state.log_stage = "input"
@@ -294,6 +479,10 @@ with tab_log:
 # STATS TAB
 with tab_stats:
     if st.button("Run Calibration"):
+        try:
+            flush_food_logs()  # make sure queued meals count
+        except Exception as e:
+            st.warning(f"Couldn't sync queued meals, calibrating without them: {e}")
         fac, msg = run_calibration_engine(USER)
         st.info(f"Factor: {fac}x ({msg})")
 
@@ -303,4 +492,5 @@ with tab_weight:
     if st.button("Log Weight"):
         d = datetime.now().strftime("%Y-%m-%d")
         get_db_connection().worksheet("Weight_Logs").append_row([d, USER, w])
+        _load_sheet.clear()
         st.success("Logged!")
\ No newline at end of file
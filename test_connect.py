@@ -1,5 +1,5 @@
 import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2.service_account import Credentials
 
 print("Attempting to connect...")
 
@@ -7,7 +7,7 @@ print("Attempting to connect...")
 scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
 
 # 2. Authenticate using your JSON key
-creds = ServiceAccountCredentials.from_json_keyfile_name("service_account.json", scope)
+creds = Credentials.from_service_account_file("service_account.json", scopes=scope)
 client = gspread.authorize(creds)
 
 # 3. Open the Sheet